@@ -3,42 +3,176 @@
 Blaude Minimal - Background Claude worker manager
 Usage: python blaude-minimal.py <command> [args...]
 """
-import subprocess
+import atexit
+import fcntl
 import json
-import uuid
 import time
 import os
 import signal
 import sys
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    import subprocess  # Imported lazily at runtime, where it's needed
+
+# Add current directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
 
 WORKERS_FILE = "/tmp/blaude-workers.json"
+# Snapshot + JSONL WAL, the protocol workers_store.py defines for the other
+# scripts; inlined here so this file runs on its own - keep the two in step
+WORKERS_LOG = WORKERS_FILE + ".wal"  # JSONL change log replayed over WORKERS_FILE
 LOGS_DIR = "/tmp/blaude-logs"
+COMPACT_SIZE = 64 * 1024  # Fold the change log into WORKERS_FILE past this size
+NOTIFY_TIMEOUT = 30  # Seconds to wait on openclaw per notification
+FINISHED_STATUSES = frozenset({"completed", "killed", "dead"})
+LOG_TAIL_BYTES = 4096  # How much of a log to read for the completion summary
 
 class WorkerManager:
     def __init__(self):
         self.workers = self.load_workers()
+        # Popen handles for workers spawned by this process, for reaping
+        self._procs: Dict[str, "subprocess.Popen"] = {}
         Path(LOGS_DIR).mkdir(exist_ok=True)
+        # Exit watching: one epoll reactor over pidfds, keyed fd -> worker name
+        self._epoll = None
+        self._pidfds: Dict[int, str] = {}
+        # Append-only persistence: mutations go to WORKERS_LOG, compacted later
+        self._log_fd = None
+        self._notifier = None
+        atexit.register(self.shutdown)
+        signal.signal(signal.SIGTERM, self._handle_sigterm)
     
-    def load_workers(self) -> Dict:
-        """Load workers from persistent storage"""
+    def load_workers(self, log_fd: Optional[int] = None) -> Dict:
+        """Load workers from the snapshot, then replay the change log over it
+        
+        compact() passes its exclusively locked log fd; otherwise a shared
+        lock is held across both reads so a compaction can't land between them.
+        """
+        fd = log_fd
+        if fd is None:
+            try:
+                fd = os.open(WORKERS_LOG, os.O_RDONLY)
+                fcntl.flock(fd, fcntl.LOCK_SH)
+            except FileNotFoundError:
+                fd = None
+        
+        workers = {}
         try:
-            if Path(WORKERS_FILE).exists():
-                with open(WORKERS_FILE, 'r') as f:
-                    return json.load(f)
-        except:
-            pass
-        return {}
+            try:
+                if Path(WORKERS_FILE).exists():
+                    with open(WORKERS_FILE, 'rb', buffering=65536) as f:
+                        workers = json.loads(f.read())
+            except:
+                pass
+            
+            if fd is None:
+                return workers
+            with os.fdopen(os.dup(fd), 'rb') as f:
+                f.seek(0)
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Torn write from a crashed process
+                    if entry["op"] == "upsert":
+                        workers[entry["name"]] = entry["worker"]
+                    elif entry["op"] == "set":
+                        # Partial update (check-completion) - only for workers still there
+                        worker = workers.get(entry["name"])
+                        if worker is not None:
+                            worker.update(entry["fields"])
+                    elif entry["op"] == "delete":
+                        workers.pop(entry["name"], None)
+        finally:
+            if fd is not None and log_fd is None:
+                os.close(fd)  # Also releases the lock
+        return workers
+    
+    def save_workers(self, *names: str):
+        """Append the current state of the named workers to the change log"""
+        lines = []
+        for name in names:
+            worker = self.workers.get(name)
+            if worker is None:
+                entry = {"op": "delete", "name": name}
+            else:
+                entry = {"op": "upsert", "name": name, "worker": worker}
+            lines.append(json.dumps(entry, separators=(',', ':')) + "\n")
+        if not lines:
+            return
+        
+        try:
+            if self._log_fd is None:
+                self._log_fd = os.open(WORKERS_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            # Shared lock: appends may interleave, but not with a compaction
+            fcntl.flock(self._log_fd, fcntl.LOCK_SH)
+            try:
+                os.write(self._log_fd, "".join(lines).encode())
+            finally:
+                fcntl.flock(self._log_fd, fcntl.LOCK_UN)
+            
+            if os.fstat(self._log_fd).st_size > COMPACT_SIZE:
+                self.compact()
+        except OSError as e:
+            print(f"❌ Error saving workers: {e}")
+    
+    def compact(self):
+        """Fold the change log into an atomically replaced snapshot, then truncate it"""
+        try:
+            fd = os.open(WORKERS_LOG, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            print(f"❌ Error compacting workers: {e}")
+            return
+        
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            # Replay from disk so other processes' entries are kept
+            data = json.dumps(self.load_workers(log_fd=fd), separators=(',', ':')).encode()
+            tmp_file = WORKERS_FILE + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, WORKERS_FILE)
+            os.ftruncate(fd, 0)
+        except Exception as e:
+            print(f"❌ Error compacting workers: {e}")
+        finally:
+            os.close(fd)  # Also releases the lock
+    
+    @property
+    def notifier(self):
+        """Shared Notifier, created on first use"""
+        if self._notifier is None:
+            from notifier import Notifier
+            self._notifier = Notifier(timeout=NOTIFY_TIMEOUT)
+        return self._notifier
     
-    def save_workers(self):
-        """Save workers to persistent storage"""
-        with open(WORKERS_FILE, 'w') as f:
-            json.dump(self.workers, f, indent=2)
+    def shutdown(self):
+        """Close the notifier helper and the change log
+        
+        No compaction here - every reader replays the log, and it's folded
+        in once it passes COMPACT_SIZE.
+        """
+        if self._notifier is not None:
+            self._notifier.close()
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+    
+    def _handle_sigterm(self, signum, frame):
+        # Exit normally so atexit shuts the helper down
+        sys.exit(128 + signum)
     
     def spawn_worker(self, name: str, prompt: str, model="haiku", 
                     budget=2.0, notify_target="dev-general"):
         """Spawn a new Claude worker in background"""
+        # Imported here so list/kill/cleanup don't pay for them at startup
+        import subprocess
+        import uuid
+        
         if name in self.workers:
             print(f"❌ Worker '{name}' already exists")
             return False
@@ -63,9 +197,10 @@ class WorkerManager:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                preexec_fn=os.setsid  # Create new process group
+                start_new_session=True  # setsid() in C, no Python preexec_fn
             )
             
+            self._procs[name] = proc
             self.workers[name] = {
                 "pid": proc.pid,
                 "session_id": session_id,
@@ -77,16 +212,11 @@ class WorkerManager:
                 "log_file": log_file
             }
             
-            self.save_workers()
+            self.save_workers(name)
             print(f"✅ Spawned worker '{name}' (PID: {proc.pid})")
             
-            # Start monitoring thread for this worker
-            import threading
-            threading.Thread(
-                target=self._monitor_worker, 
-                args=(name,), 
-                daemon=True
-            ).start()
+            # Watch for this worker's exit
+            self._watch_worker(name, proc.pid)
             
             return True
             
@@ -94,28 +224,81 @@ class WorkerManager:
             print(f"❌ Failed to spawn worker '{name}': {e}")
             return False
     
+    def _watch_worker(self, name: str, pid: int):
+        """Register a worker's pidfd with the reactor, or fall back to a waiting thread"""
+        import select
+        import threading
+        
+        try:
+            fd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            # No pidfd support (Python < 3.9 or Linux < 5.3)
+            threading.Thread(
+                target=self._monitor_worker, 
+                args=(name,), 
+                daemon=True
+            ).start()
+            return
+        
+        self._pidfds[fd] = name
+        if self._epoll is None:
+            self._epoll = select.epoll()
+            self._epoll.register(fd, select.EPOLLIN)
+            threading.Thread(target=self._reactor_loop, daemon=True).start()
+        else:
+            self._epoll.register(fd, select.EPOLLIN)
+    
+    def _reactor_loop(self):
+        """Wait on all worker pidfds and handle each exit as it happens"""
+        while True:
+            for fd, _ in self._epoll.poll():
+                name = self._pidfds.pop(fd, None)
+                self._epoll.unregister(fd)
+                proc = self._procs.pop(name, None)
+                try:
+                    # Reap the exited worker
+                    if proc:
+                        proc.wait()
+                    else:
+                        os.waitid(os.P_PIDFD, fd, os.WEXITED)
+                except ChildProcessError:
+                    pass
+                finally:
+                    os.close(fd)
+                
+                if name:
+                    self._handle_completion(name)
+    
     def _monitor_worker(self, name: str):
-        """Monitor a worker and notify when complete"""
-        worker = self.workers.get(name)
-        if not worker:
+        """Monitor a worker and notify when complete (fallback without pidfd)"""
+        proc = self._procs.get(name)
+        if not proc:
             return
         
-        pid = worker["pid"]
         try:
             # Wait for process to complete
-            os.waitpid(pid, 0)
+            self._poll_exit(proc)
+            self._procs.pop(name, None)
             
             # Process completed - check results
             self._handle_completion(name)
-            
+        
         except (OSError, ProcessLookupError):
             # Process doesn't exist or already reaped
             self._handle_completion(name)
     
+    def _poll_exit(self, proc: "subprocess.Popen"):
+        """Poll until a child exits, backing off from 5ms to 500ms"""
+        delay = 0.005
+        while proc.poll() is None:
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
+    
     def _handle_completion(self, name: str):
         """Handle worker completion and notification"""
         worker = self.workers.get(name)
-        if not worker:
+        if not worker or worker["status"] != "running":
+            # Killed workers are already accounted for
             return
         
         worker["status"] = "completed"
@@ -123,36 +306,31 @@ class WorkerManager:
         
         # Try to read output/results
         try:
-            if Path(worker["log_file"]).exists():
-                with open(worker["log_file"], 'r') as f:
-                    log_content = f.read()
-                    # Extract summary from last few lines
-                    summary = log_content.split('\n')[-10:]  # Last 10 lines
-                    summary = '\n'.join([line for line in summary if line.strip()])[:200]
-            else:
-                summary = "No output captured"
+            fd = os.open(worker["log_file"], os.O_RDONLY)
+            try:
+                # Only read the tail of the log: open, fstat, one pread
+                size = os.fstat(fd).st_size
+                offset = max(0, size - LOG_TAIL_BYTES)
+                tail = os.pread(fd, size - offset, offset).decode('utf-8', 'replace')
+            finally:
+                os.close(fd)
+            # Extract summary from last few lines
+            summary = tail.splitlines()[-10:]  # Last 10 lines
+            summary = '\n'.join([line for line in summary if line.strip()])[:200]
+        except FileNotFoundError:
+            summary = "No output captured"
         except:
             summary = "Error reading output"
         
         # Notify completion
         self._notify_completion(name, summary)
-        self.save_workers()
+        self.save_workers(name)
     
     def _notify_completion(self, name: str, summary: str):
-        """Send completion notification via openclaw"""
+        """Send completion notification through the shared Notifier"""
         worker = self.workers[name]
-        target = worker["notify_target"]
-        
         duration = int(worker.get("end_time", time.time()) - worker["start_time"])
-        message = f"🎯 Worker **{name}** completed ({duration}s)\n```\n{summary}\n```"
-        
-        try:
-            subprocess.run([
-                "openclaw", "agent", "message", target, message
-            ], check=True)
-            print(f"📤 Notified {target} about '{name}' completion")
-        except Exception as e:
-            print(f"❌ Failed to notify {target}: {e}")
+        self.notifier.notify_completion(name, summary, duration, worker["notify_target"])
     
     def kill_worker(self, name: str):
         """Kill a running worker"""
@@ -167,15 +345,25 @@ class WorkerManager:
         
         try:
             # Kill entire process group to ensure cleanup
-            os.killpg(worker["pid"], signal.SIGTERM)
             worker["status"] = "killed"
-            self.save_workers()
+            os.killpg(worker["pid"], signal.SIGTERM)
+            proc = self._procs.get(name)
+            if proc:
+                import subprocess
+                
+                # Reap it, escalating if it ignores SIGTERM
+                try:
+                    proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    os.killpg(worker["pid"], signal.SIGKILL)
+                    proc.wait()
+            self.save_workers(name)
             print(f"✅ Killed worker '{name}'")
             return True
         except (OSError, ProcessLookupError):
             print(f"⚠️ Worker '{name}' was already dead")
             worker["status"] = "dead"
-            self.save_workers()
+            self.save_workers(name)
             return True
     
     def list_workers(self):
@@ -184,27 +372,29 @@ class WorkerManager:
             print("No workers found")
             return
         
-        print(f"{'Name':<15} {'Status':<10} {'Model':<10} {'Age':<8} {'PID':<8}")
-        print("─" * 60)
+        lines = [f"{'Name':<15} {'Status':<10} {'Model':<10} {'Age':<8} {'PID':<8}", "─" * 60]
         
+        now = time.time()
         for name, worker in self.workers.items():
-            age = int(time.time() - worker["start_time"])
+            age = int(now - worker["start_time"])
             age_str = f"{age}s" if age < 60 else f"{age//60}m"
             
-            print(f"{name:<15} {worker['status']:<10} {worker['model']:<10} {age_str:<8} {worker['pid']:<8}")
+            lines.append(f"{name:<15} {worker['status']:<10} {worker['model']:<10} {age_str:<8} {worker['pid']:<8}")
+        
+        # One write for the whole table
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def cleanup_dead(self):
         """Remove completed/dead workers from tracking"""
-        to_remove = []
-        for name, worker in self.workers.items():
-            if worker["status"] in ["completed", "killed", "dead"]:
-                to_remove.append(name)
+        removed = [name for name, worker in self.workers.items()
+                   if worker["status"] in FINISHED_STATUSES]
+        self.workers = {name: worker for name, worker in self.workers.items()
+                        if worker["status"] not in FINISHED_STATUSES}
         
-        for name in to_remove:
-            del self.workers[name]
+        for name in removed:
             print(f"🗑️ Cleaned up worker '{name}'")
         
-        self.save_workers()
+        self.save_workers(*removed)
 
 def main():
     if len(sys.argv) < 2:
@@ -5,6 +5,7 @@ Integration of all modules, processes flags and prompts. TUI also accessible.
 """
 import sys
 import argparse
+from collections import Counter
 from pathlib import Path
 
 # Add current directory to path for imports
@@ -60,12 +61,17 @@ class Blaude:
         """Send a test notification"""
         return self.notifier.test_notification(target)
     
+    def export(self) -> None:
+        """Dump workers state as JSON (for debugging)"""
+        print(self.runner.export_json())
+    
     def status(self) -> None:
         """Show system status"""
         workers = self.runner.list_workers()
         
-        running = len([w for w in workers if w["status"] == "running"])
-        completed = len([w for w in workers if w["status"] == "completed"])
+        counts = Counter(w["status"] for w in workers)
+        running = counts["running"]
+        completed = counts["completed"]
         total = len(workers)
         
         print(f"📊 Blaude Status:")
@@ -117,6 +123,9 @@ Examples:
     # Status command
     subparsers.add_parser("status", help="Show system status")
     
+    # Export command
+    subparsers.add_parser("export", help="Print workers state as JSON")
+    
     # Test notification command
     test_parser = subparsers.add_parser("test-notify", help="Send test notification")
     test_parser.add_argument("target", nargs="?", default="dev-general", help="Target agent")
@@ -153,6 +162,9 @@ Examples:
     elif args.command == "status":
         app.status()
     
+    elif args.command == "export":
+        app.export()
+    
     elif args.command == "test-notify":
         success = app.test_notify(args.target)
         sys.exit(0 if success else 1)
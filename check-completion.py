@@ -1,50 +1,152 @@
 #!/usr/bin/env python3
 """
 Quick script to manually check and fix worker completion status
+Usage: python check-completion.py [--watch]
 """
-import json
 import os
+import select
+import sys
 import time
 from pathlib import Path
 
+# Add current directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+import workers_store
+
 WORKERS_FILE = "/tmp/blaude-workers.json"
+WORKERS_LOG = workers_store.wal_path(WORKERS_FILE)
+RESCAN_INTERVAL = 5  # Seconds between looks for newly spawned workers
+
+def load_workers():
+    return workers_store.load(WORKERS_FILE, WORKERS_LOG)
+
+def save_workers(workers, names):
+    """Append the named workers' new status to the WAL
+    
+    The snapshot belongs to whichever Runner/blaude-minimal compacts next;
+    writing it here would race their compaction and lose entries.
+    """
+    workers_store.append_to(WORKERS_LOG, (
+        {"op": "set", "name": name,
+         "fields": {"status": workers[name]["status"], "end_time": workers[name]["end_time"]}}
+        for name in names
+    ))
+
+def mark_completed(name, worker):
+    print(f"🎯 {name}: completed! Updating status...")
+    worker["status"] = "completed"
+    worker["end_time"] = time.time()
+    
+    # Simulate completion notification
+    duration = int(worker.get("end_time", time.time()) - worker["start_time"])
+    print(f"   Duration: {duration}s")
+    
+    # Check if log file has results
+    log_file = worker.get("log_file", f"/tmp/blaude-logs/{name}.log")
+    if Path(log_file).exists():
+        print(f"   Log: {log_file}")
+
+def is_running(pid):
+    try:
+        os.kill(pid, 0)  # Doesn't kill, just checks existence
+        return True
+    except (OSError, ProcessLookupError):
+        return False
+
+def pidfds_supported():
+    """Check for pidfd_open (Python 3.9+ on Linux 5.3+)"""
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+        return True
+    except (AttributeError, OSError):
+        return False
 
 def check_and_fix_workers():
-    if not Path(WORKERS_FILE).exists():
-        print("No workers file found")
+    workers = load_workers()
+    if not workers:
+        print("No workers found")
         return
     
-    with open(WORKERS_FILE, 'r') as f:
-        workers = json.load(f)
-    
-    updated = False
+    updated = []
     for name, worker in workers.items():
         if worker["status"] == "running":
             pid = worker["pid"]
-            try:
-                # Check if process exists
-                os.kill(pid, 0)  # Doesn't kill, just checks existence
+            if is_running(pid):
                 print(f"✅ {name}: still running (PID {pid})")
-            except (OSError, ProcessLookupError):
+            else:
                 # Process is dead
-                print(f"🎯 {name}: completed! Updating status...")
-                worker["status"] = "completed"  
-                worker["end_time"] = time.time()
-                updated = True
-                
-                # Simulate completion notification
-                duration = int(worker.get("end_time", time.time()) - worker["start_time"])
-                print(f"   Duration: {duration}s")
-                
-                # Check if log file has results
-                log_file = worker.get("log_file", f"/tmp/blaude-logs/{name}.log")
-                if Path(log_file).exists():
-                    print(f"   Log: {log_file}")
+                mark_completed(name, worker)
+                updated.append(name)
     
     if updated:
-        with open(WORKERS_FILE, 'w') as f:
-            json.dump(workers, f, indent=2)
+        save_workers(workers, updated)
         print("✅ Worker statuses updated")
 
+def watch_workers():
+    """Update worker statuses the moment they exit, via pidfds"""
+    if not pidfds_supported():
+        # No pidfd support - fall back to periodic checks
+        while True:
+            check_and_fix_workers()
+            time.sleep(RESCAN_INTERVAL)
+    
+    poller = select.poll()
+    watched = {}  # pidfd -> (name, pid)
+    
+    print(f"👀 Watching {WORKERS_FILE} for worker exits (Ctrl-C to stop)")
+    while True:
+        exited = []
+        
+        # Pick up running workers we aren't watching yet
+        workers = load_workers()
+        watched_pids = {pid for _, pid in watched.values()}
+        for name, worker in workers.items():
+            pid = worker.get("pid")
+            if worker["status"] != "running" or not pid or pid in watched_pids:
+                continue
+            try:
+                fd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                exited.append((name, pid))
+                continue
+            except OSError as e:
+                # e.g. out of fds - probe it instead, and retry the pidfd next rescan
+                if not is_running(pid):
+                    exited.append((name, pid))
+                else:
+                    print(f"⚠️ {name}: can't watch PID {pid} ({e}), retrying")
+                continue
+            watched[fd] = (name, pid)
+            poller.register(fd, select.POLLIN)
+            print(f"✅ {name}: running (PID {pid})")
+        
+        # Block until a worker exits, or it's time to rescan
+        if not exited:
+            for fd, _ in poller.poll(RESCAN_INTERVAL * 1000):
+                poller.unregister(fd)
+                os.close(fd)
+                exited.append(watched.pop(fd))
+        
+        if not exited:
+            continue
+        
+        # Apply the whole batch against fresh state, then write once
+        workers = load_workers()
+        updated = []
+        for name, pid in exited:
+            worker = workers.get(name)
+            if worker and worker["status"] == "running" and worker.get("pid") == pid:
+                mark_completed(name, worker)
+                updated.append(name)
+        if updated:
+            save_workers(workers, updated)
+
 if __name__ == "__main__":
-    check_and_fix_workers()
\ No newline at end of file
+    try:
+        if "--watch" in sys.argv[1:]:
+            watch_workers()
+        else:
+            check_and_fix_workers()
+    except KeyboardInterrupt:
+        pass
\ No newline at end of file
@@ -2,21 +2,20 @@
 """
 Quick script for me to check if any workers completed
 """
-import json
+import sys
 import time
 from pathlib import Path
 
+# Add current directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+import workers_store
+
 def check_recent_completions():
     """Check for recently completed workers"""
-    workers_file = Path("/tmp/blaude-workers.json")
-    if not workers_file.exists():
-        return []
-    
-    try:
-        with open(workers_file, 'r') as f:
-            workers = json.load(f)
-    except:
-        return []
+    # Snapshot plus WAL - recent completions may not be compacted yet
+    workers_file = "/tmp/blaude-workers.json"
+    workers = workers_store.load(workers_file, workers_store.wal_path(workers_file))
     
     recent_completions = []
     current_time = time.time()
@@ -2,15 +2,39 @@
 """
 Notifier - OpenClaw integration for completion notifications
 """
+import json
+import os
+import select
 import subprocess
+import threading
 import time
 from typing import Optional
 
 class Notifier:
     """Handles notifications to OpenClaw agents when workers complete"""
     
-    def __init__(self):
-        pass
+    # Long-lived openclaw helper reading one JSON request per line on stdin
+    # and answering each with a JSON ack line ({"ok": true}) on stdout. Opt-in
+    # (use_server=True or BLAUDE_OPENCLAW_SERVER=1) for openclaw builds that have it
+    SERVER_CMD = ["openclaw", "--server-mode", "agent"]
+    
+    def __init__(self, timeout: int = 30, use_server: Optional[bool] = None):
+        self.timeout = timeout
+        if use_server is None:
+            use_server = os.environ.get("BLAUDE_OPENCLAW_SERVER") == "1"
+        self._proc = None
+        self._server_failed = not use_server  # Never started unless asked for
+        self._server_answered = False  # Has the helper ever acked a request?
+        self._lock = threading.Lock()
+        
+        # If openclaw is installed as a Python package exposing
+        # send_message(agent=, msg=), messages are sent in-process - no
+        # helper or subprocess at all
+        try:
+            from openclaw import send_message
+        except ImportError:
+            send_message = None
+        self._send_message = send_message
     
     def notify_completion(self, worker_name: str, summary: str, duration: int, 
                          target: str = "dev-general") -> bool:
@@ -73,7 +97,15 @@ class Notifier:
         return message
     
     def _send_openclaw_message(self, target: str, message: str) -> bool:
-        """Send message via openclaw agent message command"""
+        """Send message via the openclaw library, helper, or agent command"""
+        sent = self._send_in_process(target, message)
+        if sent is None:
+            sent = self._send_via_server(target, message)
+        if sent is not None:
+            if sent:
+                print(f"📤 Notified {target}: {message[:50]}...")
+            return sent
+        
         try:
             cmd = ["openclaw", "agent", "--agent", target, "-m", message]
             
@@ -81,7 +113,7 @@ class Notifier:
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=30  # 30 second timeout
+                timeout=self.timeout
             )
             
             if result.returncode == 0:
@@ -98,6 +130,112 @@ class Notifier:
             print(f"❌ Error sending notification to {target}: {e}")
             return False
     
+    def _send_in_process(self, target: str, message: str) -> Optional[bool]:
+        """Send through the openclaw Python package; None if it isn't installed"""
+        if self._send_message is None:
+            return None
+        try:
+            return self._send_message(agent=target, msg=message) is not False
+        except (TypeError, AttributeError) as e:
+            # Not the send_message(agent=, msg=) we expect - use the CLI from now on
+            print(f"⚠️ openclaw.send_message unusable ({e}), falling back to the openclaw CLI")
+            self._send_message = None
+            return None
+        except Exception as e:
+            # It may have got through, so don't resend another way
+            print(f"❌ Error sending notification to {target}: {e}")
+            return False
+    
+    def _send_via_server(self, target: str, message: str) -> Optional[bool]:
+        """Send through the persistent openclaw helper; None if it's unavailable"""
+        with self._lock:
+            proc = self._get_server()
+            if proc is None:
+                return None
+            
+            request = json.dumps({"target": target, "message": message}) + "\n"
+            try:
+                proc.stdin.write(request.encode())
+                proc.stdin.flush()
+                line = self._read_ack_line(proc)
+                if line is None:
+                    # A hung helper would stall every later message too
+                    self._server_failed = True
+                    self._close_server(kill=True)
+                    if not self._server_answered:
+                        return None  # It never worked, so nothing was sent - fall back
+                    # The message may already be delivered, so don't resend
+                    print(f"❌ Timeout sending notification to {target}")
+                    return False
+                ack = json.loads(line)
+                if not isinstance(ack, dict):
+                    raise ValueError(f"unexpected ack: {ack!r}")
+                self._server_answered = True
+            except (OSError, ValueError):
+                # Helper died or doesn't speak the protocol - stop using it
+                self._server_failed = True
+                self._close_server()
+                return None
+        
+        if not ack.get("ok"):
+            print(f"❌ Failed to notify {target}: {ack.get('error', 'unknown error')}")
+            return False
+        return True
+    
+    def _read_ack_line(self, proc: subprocess.Popen) -> Optional[bytes]:
+        """One line from the helper, or None if it doesn't finish one within the timeout"""
+        fd = proc.stdout.fileno()
+        deadline = time.monotonic() + self.timeout
+        buf = b""
+        while b"\n" not in buf:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return None
+            # Raw reads, so a partial line can't block us the way readline() would
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                raise OSError("openclaw helper closed its stdout")
+            buf += chunk
+        return buf[:buf.index(b"\n")]
+    
+    def _get_server(self) -> Optional[subprocess.Popen]:
+        """Return the running openclaw helper, starting it on first use"""
+        if self._server_failed:
+            return None
+        if self._proc is None or self._proc.poll() is not None:
+            try:
+                self._proc = subprocess.Popen(
+                    self.SERVER_CMD,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+            except OSError:
+                self._server_failed = True
+                return None
+        return self._proc
+    
+    def _close_server(self, kill: bool = False):
+        if self._proc is None:
+            return
+        try:
+            if kill:
+                self._proc.kill()  # Hung - no point waiting for a clean exit
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+    
+    def close(self):
+        """Shut down the openclaw helper if one is running"""
+        with self._lock:
+            self._close_server()
+    
     def test_notification(self, target: str = "dev-general") -> bool:
         """Send a test notification to verify the system works"""
         test_message = "🧪 Blaude notification test - system is working!"
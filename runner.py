@@ -2,58 +2,271 @@
 """
 Runner - Claude Code worker management and session tracking
 """
+import atexit
+import fcntl
 import subprocess
 import json
+import tempfile
 import uuid
 import time
 import os
+import re
+import select
 import signal
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional, List
 
+import workers_store
+from workers_store import dumps as _dumps, loads as _loads  # orjson when installed
+
+SNAPSHOT_VERSION = 1  # Layout of msgpack snapshots: {"v": ..., "workers": {...}}
+_DONE = frozenset({"completed", "killed", "dead"})  # Statuses cleanup_completed removes
+AUTH_CACHE_TTL = 300  # Seconds a successful `claude auth status` is trusted for
+FLUSH_INTERVAL = 2.0  # Max seconds between a change and the snapshot write
+SUMMARY_TAIL_BYTES = 64 * 1024  # How much of a log to scan for the result
+NOTIFY_WORKERS = 4  # Completions (summary read + notification) in flight at once
+# The JSON string value of a "result" key, matched on raw log bytes
+_RESULT_RE = re.compile(rb'"result"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_RESULT_TYPE_RE = re.compile(rb'"type"\s*:\s*"result"')
+# Debug log lines start with a date, e.g. 2026-01-31T... (the TUI uses this too)
+TIMESTAMP_RE = re.compile(rb'\d{4}-\d{2}-\d{2}')
+
+def find_result(buf: bytes) -> Optional[str]:
+    """The last "result" string in buf that belongs to a result object
+    
+    Only lines that are a JSON object, or say "type": "result", count - debug
+    lines can have other JSON (e.g. MCP replies) with a "result" key inside.
+    """
+    if b'"result"' not in buf:
+        return None  # Most logs, until the very end
+    for match in reversed(list(_RESULT_RE.finditer(buf))):
+        start = buf.rfind(b'\n', 0, match.start()) + 1
+        end = buf.find(b'\n', match.end())
+        line = buf[start:end] if end >= 0 else buf[start:]
+        if not (line.lstrip().startswith(b'{') or _RESULT_TYPE_RE.search(line)):
+            continue
+        try:
+            return _loads(b'"' + match.group(1) + b'"')
+        except ValueError:
+            continue
+    return None
+
 class Runner:
     """Manages Claude Code worker processes with session tracking"""
     
-    def __init__(self, workers_file="/tmp/blaude-workers.json", logs_dir="/tmp/blaude-logs"):
+    def __init__(self, workers_file="/tmp/blaude-workers.json", logs_dir="/tmp/blaude-logs", loop=None):
         self.workers_file = Path(workers_file)
+        # Append-only log of changes since the last snapshot (see workers_store)
+        self.wal_file = Path(workers_store.wal_path(self.workers_file))
+        # A .msgpack workers file gets a binary snapshot (needs msgpack); the
+        # default JSON one is what check-completion.py and the TUI read
+        self._msgpack = None
+        if self.workers_file.suffix == ".msgpack":
+            import msgpack
+            self._msgpack = msgpack
         self.logs_dir = Path(logs_dir)
+        self._logs_dir_str = str(self.logs_dir)  # For building log paths without pathlib
         self.workers = self.load_workers()
         self.logs_dir.mkdir(exist_ok=True)
         
-        # Start periodic status checker
+        # State lives in memory: changes are appended to the WAL and the
+        # snapshot is rewritten at most once per FLUSH_INTERVAL
+        self._wal_fd = None
+        self._wal_lock = threading.Lock()
+        self._flush_timer = None
+        atexit.register(self._shutdown)
+        
+        # One snapshot write at a time within this process (flock covers
+        # other processes); a save requested while one waits is folded in
+        self._save_lock = threading.Lock()
+        self._save_queued = False
+        
+        # Monotonic time of the last successful auth check (0 = not yet)
+        self._auth_checked_at = 0.0
+        
+        # Rows handed out by list_workers, updated in place between calls
+        self._workers_view: Dict[str, Dict] = {}
+        
+        # Exit watching: Popen handles for our own children (for reaping),
+        # and pidfds for every running worker, keyed fd -> worker name
+        self._procs: Dict[str, subprocess.Popen] = {}
+        self._fd_to_name: Dict[int, str] = {}
+        self._epoll = None
+        # Running workers we couldn't get a pidfd for (e.g. out of fds), name -> pid;
+        # checked every 5 seconds like the polling fallback
+        self._polled: Dict[str, int] = {}
+        self._poll_scheduled = False
+        # Our children's stdout is read as they run; the last result seen
+        # is kept so completion doesn't have to go back to the log
+        self._readers: Dict[str, threading.Thread] = {}
+        self._last_result: Dict[str, str] = {}
+        self._watching = False
+        # Given an asyncio loop (e.g. the TUI's), exits are handled on it
+        # instead of a monitor thread - call the Runner from that loop's thread
+        self._loop = loop
+        
+        # One Notifier (and its openclaw helper) shared by all completions;
+        # summaries are read and sent on background threads so the monitor
+        # (or the event loop) never blocks, and a burst of exits is read in parallel
+        self._notifier = None
+        self._notify_pool = ThreadPoolExecutor(max_workers=NOTIFY_WORKERS, thread_name_prefix="blaude-notify")
+        
+        # Optional callback taking the names of workers whose state changed; runs
+        # on the loop's thread if a loop was given, else on whichever made the change
+        self.on_change = None
+        
+        # Start status monitor
         self._start_status_monitor()
     
     def load_workers(self) -> Dict:
-        """Load workers from persistent storage"""
-        try:
-            if self.workers_file.exists():
-                with open(self.workers_file, 'r') as f:
-                    return json.load(f)
-        except Exception as e:
-            print(f"Warning: Could not load workers file: {e}")
-        return {}
+        """Load workers from the snapshot, then replay the WAL over it"""
+        return workers_store.load(self.workers_file, self.wal_file, self._decode_snapshot)
+    
+    def reload_workers(self):
+        """Pick up changes made by other processes (e.g. workers the CLI spawned)"""
+        watched = set(self._fd_to_name.values()) | self._polled.keys()
+        self.workers = self.load_workers()
+        for name, worker in tuple(self.workers.items()):
+            if worker["status"] == "running" and worker.get("pid") and name not in watched:
+                self._watch_worker(name, worker["pid"])
+    
+    def list_workers_since(self, since: Optional[tuple]) -> tuple:
+        """(stamp, workers) from disk, with workers None if nothing changed since `since`
+        
+        The stamp is opaque; pass the last one back in (None for a full load).
+        """
+        stamp = []
+        for path in (self.workers_file, self.wal_file):
+            try:
+                st = os.stat(path)
+                stamp.append((st.st_ino, st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                stamp.append(None)
+        stamp = tuple(stamp)
+        
+        if stamp == since:
+            return stamp, None
+        return stamp, self.load_workers()
     
     def save_workers(self):
-        """Save workers to persistent storage"""
-        try:
-            with open(self.workers_file, 'w') as f:
-                json.dump(self.workers, f, indent=2)
-        except Exception as e:
-            print(f"Error saving workers: {e}")
+        """Write a full snapshot and truncate the WAL"""
+        if self._save_queued:
+            return  # The save waiting on the lock hasn't read the WAL yet, so it covers us
+        self._save_queued = True
+        
+        with self._save_lock:
+            self._save_queued = False
+            try:
+                fd = os.open(self.wal_file, os.O_RDWR | os.O_CREAT, 0o644)
+            except OSError as e:
+                print(f"Error saving workers: {e}")
+                return
+            
+            tmp_file = None
+            try:
+                # Exclusive lock keeps other processes' appends out of the window
+                # between reading the WAL and truncating it
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                # Replay from disk so changes made by other processes are kept
+                # (through our fd - a second lock on the WAL would wait on ours)
+                data = self._encode_snapshot(workers_store.load(self.workers_file, self.wal_file,
+                                                                self._decode_snapshot, wal_fd=fd))
+                with tempfile.NamedTemporaryFile(dir=self.workers_file.parent, prefix=self.workers_file.name,
+                                                 suffix=".tmp", delete=False) as f:
+                    tmp_file = f.name
+                    os.fchmod(f.fileno(), 0o644)  # Same mode as the WAL, not mkstemp's 0600
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                # Only drop the WAL once the snapshot that replaces it is durable
+                os.replace(tmp_file, self.workers_file)
+                tmp_file = None
+                os.ftruncate(fd, 0)
+            except Exception as e:
+                print(f"Error saving workers: {e}")
+            finally:
+                os.close(fd)  # Also releases the lock
+                if tmp_file:
+                    os.unlink(tmp_file)
+    
+    def _encode_snapshot(self, workers: Dict) -> bytes:
+        if self._msgpack:
+            return self._msgpack.packb({"v": SNAPSHOT_VERSION, "workers": workers}, use_bin_type=True)
+        return _dumps(workers)
+    
+    def _decode_snapshot(self, data: bytes) -> Dict:
+        if self._msgpack:
+            snapshot = self._msgpack.unpackb(data, raw=False)
+            if snapshot.get("v") != SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported snapshot version {snapshot.get('v')}")
+            return snapshot["workers"]
+        return _loads(data)
+    
+    def export_json(self) -> str:
+        """Current workers state as indented JSON, whatever the snapshot format"""
+        return json.dumps(self.workers, indent=2)
+    
+    def _mark_dirty(self, *names: str):
+        """Append the named workers' current state to the WAL and schedule a snapshot"""
+        records = []
+        for name in names:
+            worker = self.workers.get(name)
+            if worker is None:
+                records.append({"op": "delete", "name": name})
+            else:
+                records.append({"op": "upsert", "name": name, "worker": dict(worker)})
+        
+        with self._wal_lock:
+            try:
+                if self._wal_fd is None:
+                    self._wal_fd = workers_store.open_wal(self.wal_file)
+                workers_store.append(self._wal_fd, records, fsync=True)
+            except OSError as e:
+                print(f"Error saving workers: {e}")
+            
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(FLUSH_INTERVAL, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        
+        if self.on_change:
+            self.on_change(names)
+    
+    def _flush(self):
+        with self._wal_lock:
+            self._flush_timer = None
+        self.save_workers()
+    
+    def _shutdown(self):
+        """Write out any pending snapshot before the process exits"""
+        with self._wal_lock:
+            timer, self._flush_timer = self._flush_timer, None
+        if timer:
+            timer.cancel()
+            self.save_workers()
     
     def set_env_wizard(self):
         """Prompts user to set claude code api key and sets env if not found"""
+        # Auth rarely changes within a session - skip the fork if we checked recently
+        if self._auth_checked_at and time.monotonic() - self._auth_checked_at < AUTH_CACHE_TTL:
+            return True
+        
         # Check if Claude Code is authenticated
         try:
             result = subprocess.run(["claude", "auth", "status"], 
                                   capture_output=True, text=True, timeout=10)
             if "authenticated" in result.stdout.lower():
                 print("✅ Claude Code is authenticated")
+                self._auth_checked_at = time.monotonic()
                 return True
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
         
+        self._auth_checked_at = 0.0  # Failures are never cached
+        
         print("❌ Claude Code not authenticated. Please run:")
         print("   claude auth")
         print("   or set ANTHROPIC_API_KEY environment variable")
@@ -61,8 +274,8 @@ class Runner:
     
     def get_config(self, name: str, command: str, env: dict = None) -> Dict:
         """Generate configuration for a worker"""
-        session_id = str(uuid.uuid4())
-        log_file = self.logs_dir / f"{name}.log"
+        session_id = str(uuid.uuid4())  # --session-id wants the dashed form, not .hex
+        log_file = os.path.join(self._logs_dir_str, name + ".log")
         
         if env is None:
             env = {}
@@ -71,7 +284,7 @@ class Runner:
             "name": name,
             "session_id": session_id,
             "command": command,
-            "log_file": str(log_file),
+            "log_file": log_file,
             "env": env,
             "created_at": time.time()
         }
@@ -94,6 +307,7 @@ class Runner:
         config = self.get_config(name, prompt)
         session_id = config["session_id"]
         log_file = config["log_file"]
+        output_file = None  # Where a background worker's stdout goes, if not to us
         
         # Build claude command
         cmd = [
@@ -101,28 +315,46 @@ class Runner:
             "--session-id", session_id,
             "--model", model,
             "--max-budget-usd", str(budget),
-            "--debug-file", str(log_file),
+            "--debug-file", log_file,
             "--output-format", "json",
             prompt
         ]
         
         try:
             if background:
-                # Use nohup for true background execution
-                cmd = ["nohup"] + cmd
                 # Ensure environment variables are passed
                 env = os.environ.copy()
                 env.update(config.get("env", {}))
                 
-                proc = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    preexec_fn=os.setsid,  # Create new process group
-                    cwd=str(Path.cwd()),
-                    env=env  # Pass environment variables
-                )
+                # A Runner on an event loop (the TUI) outlives its workers, so it
+                # reads their stdout as they go (see _read_output). CLI processes
+                # exit right after spawning: a pipe would lose its reader, so
+                # stdout goes to a file next to the log instead
+                if self._loop is not None:
+                    stdout = subprocess.PIPE
+                else:
+                    output_file = os.path.join(self._logs_dir_str, name + ".out")
+                    stdout = open(output_file, 'wb')
+                try:
+                    proc = subprocess.Popen(
+                        cmd,
+                        stdout=stdout,
+                        stderr=subprocess.DEVNULL,  # Nothing reads it; a full pipe would block the worker
+                        start_new_session=True,  # setsid() without a preexec_fn; detaches from our terminal
+                        close_fds=True,
+                        cwd=os.getcwd(),
+                        env=env  # Pass environment variables
+                    )
+                finally:
+                    if stdout is not subprocess.PIPE:
+                        stdout.close()  # The worker has its own copy
                 pid = proc.pid
+                self._procs[name] = proc
+                if stdout is subprocess.PIPE:
+                    reader = threading.Thread(target=self._read_output, args=(name, proc.stdout),
+                                              name=f"blaude-output-{name}", daemon=True)
+                    reader.start()
+                    self._readers[name] = reader
             else:
                 # Run in foreground for testing
                 env = os.environ.copy()
@@ -143,13 +375,15 @@ class Runner:
                 "prompt": prompt,
                 "start_time": time.time(),
                 "status": "running" if background else "completed",
-                "log_file": str(log_file),
+                "log_file": log_file,
+                "output_file": output_file,
                 "background": background
             }
             
-            self.save_workers()
+            self._mark_dirty(name)
             
             if background:
+                self._watch_worker(name, pid)
                 print(f"✅ Started worker '{name}' (PID: {pid})")
             else:
                 print(f"✅ Completed worker '{name}' (foreground)")
@@ -176,116 +410,340 @@ class Runner:
             os.killpg(worker["pid"], signal.SIGTERM)
             worker["status"] = "killed"
             worker["end_time"] = time.time()
-            self.save_workers()
+            self._mark_dirty(name)
             print(f"✅ Killed worker '{name}'")
             return True
         except (OSError, ProcessLookupError):
             worker["status"] = "dead"
             worker["end_time"] = time.time()
-            self.save_workers()
+            self._mark_dirty(name)
             print(f"⚠️ Worker '{name}' was already dead")
             return True
     
+    def remove_worker(self, name: str):
+        """Stop tracking a worker whatever its status (even one only on disk)"""
+        self.workers.pop(name, None)
+        self._readers.pop(name, None)
+        self._last_result.pop(name, None)
+        self._mark_dirty(name)
+    
     def list_workers(self) -> List[Dict]:
         """Get list of all workers with status"""
-        workers_list = []
+        return [dict(view) for view in self.list_workers_snapshot()]
+    
+    def list_workers_snapshot(self) -> tuple:
+        """Like list_workers, but the row dicts are reused across calls - don't mutate them"""
+        views = self._workers_view
+        for name in views.keys() - self.workers.keys():
+            del views[name]
+        
+        now = time.time()
+        rows = []
         for name, worker in self.workers.items():
-            age = int(time.time() - worker["start_time"])
-            workers_list.append({
-                "name": name,
-                "status": worker["status"],
-                "model": worker["model"],
-                "age_seconds": age,
-                "pid": worker.get("pid"),
-                "notify_target": worker["notify_target"]
-            })
-        return workers_list
+            view = views.get(name)
+            if view is None:
+                view = views[name] = {"name": name}
+            # Every field, every call - a name can be removed and re-added in between
+            view["status"] = worker["status"]
+            view["model"] = worker["model"]
+            view["age_seconds"] = int(now - worker["start_time"])
+            view["pid"] = worker.get("pid")
+            view["notify_target"] = worker["notify_target"]
+            rows.append(view)
+        return tuple(rows)
     
     def cleanup_completed(self) -> int:
         """Remove completed workers from tracking"""
-        to_remove = [name for name, worker in self.workers.items() 
-                    if worker["status"] in ["completed", "killed", "dead"]]
+        kept = {name: worker for name, worker in self.workers.items()
+                if worker["status"] not in _DONE}
+        removed = self.workers.keys() - kept.keys()
+        self.workers = kept
         
-        for name in to_remove:
-            del self.workers[name]
+        for name in removed:
+            self._readers.pop(name, None)
+            self._last_result.pop(name, None)
         
-        if to_remove:
-            self.save_workers()
-            print(f"🗑️ Cleaned up {len(to_remove)} workers")
+        if removed:
+            self._mark_dirty(*removed)
+            print(f"🗑️ Cleaned up {len(removed)} workers")
         
-        return len(to_remove)
+        return len(removed)
     
     def _start_status_monitor(self):
-        """Start background thread to monitor worker status"""
-        def monitor_loop():
-            while True:
+        """Start monitoring worker status - on the event loop if given, else a background thread"""
+        if self._pidfds_supported():
+            self._watching = True
+            if self._loop is None:
+                self._epoll = select.epoll()
+            # Pick up workers left running by earlier processes; the ones that
+            # finished while nobody was watching complete as one batch
+            gone = [name for name, worker in self.workers.items()
+                    if worker["status"] == "running" and worker.get("pid")
+                    and not self._watch_worker(name, worker["pid"], batch=True)]
+            if gone:
+                self._on_workers_exit(gone)
+            if self._loop is not None:
+                return  # The loop's selector does the waiting
+            target = self._pidfd_loop
+        elif self._loop is not None:
+            def check():
                 self._check_worker_statuses()
-                time.sleep(5)  # Check every 5 seconds
+                self._loop.call_later(5, check)
+            self._loop.call_soon(check)
+            return
+        else:
+            def target():
+                while True:
+                    self._check_worker_statuses()
+                    time.sleep(5)  # Check every 5 seconds
         
-        thread = threading.Thread(target=monitor_loop, daemon=True)
+        thread = threading.Thread(target=target, daemon=True)
         thread.start()
     
+    def _pidfds_supported(self) -> bool:
+        """Check for pidfd_open (Python 3.9+ on Linux 5.3+)"""
+        try:
+            os.close(os.pidfd_open(os.getpid()))
+            return True
+        except (AttributeError, OSError):
+            return False
+    
+    def _watch_worker(self, name: str, pid: int, batch: bool = False) -> bool:
+        """Register a worker's pidfd so the monitor wakes when it exits
+        
+        Returns False if the worker has already exited; with batch=True the
+        caller is left to complete it.
+        """
+        if not self._watching:
+            return True  # Polling fallback picks it up
+        
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            fd = None
+        except OSError as e:
+            # EMFILE/ENFILE and the like - poll this one instead
+            if not self._has_exited(name, pid):
+                print(f"⚠️ Can't watch worker '{name}' ({e}), polling it instead")
+                self._polled[name] = pid
+                self._schedule_poll()
+                return True
+            fd = None
+        
+        if fd is None:
+            # Already gone
+            if not batch:
+                self._on_workers_exit([name])
+            return False
+        
+        self._fd_to_name[fd] = name
+        if self._loop is not None:
+            self._loop.add_reader(fd, self._on_pidfd_ready, fd)
+        else:
+            self._epoll.register(fd, select.EPOLLIN)
+        return True
+    
+    def _schedule_poll(self):
+        """Arrange for _poll_unwatched to run in 5 seconds (once)"""
+        if self._poll_scheduled:
+            return
+        self._poll_scheduled = True
+        if self._loop is not None:
+            self._loop.call_later(5, self._poll_unwatched)
+        else:
+            timer = threading.Timer(5, self._poll_unwatched)
+            timer.daemon = True
+            timer.start()
+    
+    def _poll_unwatched(self):
+        """Check the workers without a pidfd, and keep at it while any are running"""
+        self._poll_scheduled = False
+        exited = [name for name, pid in list(self._polled.items()) if self._has_exited(name, pid)]
+        for name in exited:
+            del self._polled[name]
+        if exited:
+            self._on_workers_exit(exited)
+        if self._polled:
+            self._schedule_poll()
+    
+    def _on_pidfd_ready(self, fd: int):
+        """Event loop callback for a worker's pidfd becoming readable"""
+        self._loop.remove_reader(fd)
+        os.close(fd)
+        self._on_workers_exit([self._fd_to_name.pop(fd)])
+    
+    def _pidfd_loop(self):
+        """Block until any watched worker exits - no periodic wakeups"""
+        while True:
+            # One wakeup returns every worker that exited since the last one
+            names = []
+            for fd, _ in self._epoll.poll():
+                names.append(self._fd_to_name.pop(fd))
+                self._epoll.unregister(fd)
+                os.close(fd)
+            self._on_workers_exit(names)
+    
+    def _on_workers_exit(self, names: List[str]):
+        """Reap a batch of exited workers and complete the ones still running"""
+        now = time.time()
+        completed = []
+        for name in names:
+            proc = self._procs.pop(name, None)
+            if proc:
+                proc.poll()
+            
+            worker = self.workers.get(name)
+            if worker and worker["status"] == "running":
+                worker["status"] = "completed"
+                worker["end_time"] = now
+                completed.append(name)
+        
+        if not completed:
+            return
+        
+        # One state write for the whole batch; everything slower is queued
+        self._mark_dirty(*completed)
+        for name in completed:
+            self._handle_completion(name)
+    
     def _check_worker_statuses(self):
-        """Check and update status of running workers"""
-        updated = False
-        for name, worker in list(self.workers.items()):
-            if worker["status"] == "running" and worker.get("pid"):
-                try:
-                    os.kill(worker["pid"], 0)  # Check if process exists
-                except (OSError, ProcessLookupError):
-                    # Process is dead - mark as completed
-                    worker["status"] = "completed"
-                    worker["end_time"] = time.time()
-                    updated = True
-                    self._handle_completion(name)
-        
-        if updated:
-            self.save_workers()
+        """Check and update status of running workers (fallback without pidfds)"""
+        exited = []
+        # Copy just the names - other threads may add or remove workers meanwhile
+        for name in tuple(self.workers):
+            worker = self.workers.get(name)
+            if (worker and worker["status"] == "running" and worker.get("pid")
+                    and self._has_exited(name, worker["pid"])):
+                exited.append(name)
+        if exited:
+            self._on_workers_exit(exited)
+    
+    def _has_exited(self, name: str, pid: int) -> bool:
+        """Non-blocking exit check for one worker"""
+        proc = self._procs.get(name)
+        if proc is not None:
+            # Our own child: a single WNOHANG wait both checks and reaps
+            return proc.poll() is not None
+        
+        # Spawned by another process - we can't wait on it, only probe
+        try:
+            os.kill(pid, 0)
+            return False
+        except (OSError, ProcessLookupError):
+            return True
+    
+    @property
+    def notifier(self):
+        """Shared Notifier, created on first use"""
+        if self._notifier is None:
+            from notifier import Notifier
+            self._notifier = Notifier()
+        return self._notifier
     
     def _handle_completion(self, name: str):
         """Handle worker completion and notification"""
-        from notifier import Notifier
-        
         worker = self.workers.get(name)
         if not worker:
             return
         
         duration = int(worker.get("end_time", time.time()) - worker["start_time"])
         
-        # Get summary from log file
-        summary = self._extract_summary(worker["log_file"])
-        
-        # Send notification
-        notifier = Notifier()
-        notifier.notify_completion(name, summary, duration, worker["notify_target"])
+        # Queue the summary read and notification and return without waiting
+        # on the reader thread, the log or openclaw
+        self._notify_pool.submit(self._notify_completion, name, worker["log_file"],
+                                 worker.get("output_file"), duration, worker["notify_target"])
+    
+    def _notify_completion(self, name: str, log_file: str, output_file: Optional[str],
+                           duration: int, target: str):
+        """Send the completion notice with the worker's result (notify pool thread)"""
+        # The result the worker printed, else whatever the log file has
+        summary = self._take_result(name)
+        if summary is None and output_file:
+            summary = self._read_result_file(output_file)
+        if summary is None:
+            summary = self._extract_summary(log_file)
+        self.notifier.notify_completion(name, summary, duration, target)
+    
+    def _read_output(self, name: str, stream):
+        """Keep the last result line from a worker's stdout (reader thread)"""
+        with stream:
+            for line in stream:
+                if b'"result"' not in line:
+                    continue
+                try:
+                    data = _loads(line)
+                except ValueError:
+                    continue
+                if isinstance(data, dict) and isinstance(data.get('result'), str):
+                    self._last_result[name] = data['result']
+    
+    def _take_result(self, name: str) -> Optional[str]:
+        """Result captured from the worker's stdout, if we spawned it"""
+        reader = self._readers.pop(name, None)
+        if reader:
+            reader.join(timeout=1)  # Let it drain what was written before the exit
+        result = self._last_result.pop(name, None)
+        if result is None:
+            return None
+        return result[:300] + "..." if len(result) > 300 else result
+    
+    def _read_result_file(self, output_file: str) -> Optional[str]:
+        """Result from a worker's saved stdout, if it printed one"""
+        try:
+            with open(output_file, 'rb') as f:
+                f.seek(max(0, f.seek(0, os.SEEK_END) - SUMMARY_TAIL_BYTES))
+                result = find_result(f.read())
+        except OSError:
+            return None
+        if result is None:
+            return None
+        return result[:300] + "..." if len(result) > 300 else result
     
     def _extract_summary(self, log_file: str) -> str:
         """Extract meaningful summary from worker log file"""
         try:
-            log_path = Path(log_file)
-            if not log_path.exists():
+            try:
+                f = open(log_file, 'rb')
+            except FileNotFoundError:
                 return "No output captured"
             
-            with open(log_path, 'r') as f:
-                content = f.read()
+            with f:
+                # Only the tail of the log matters - the result comes last
+                f.seek(0, os.SEEK_END)
+                offset = max(0, f.tell() - SUMMARY_TAIL_BYTES)
+                f.seek(offset)
+                tail = f.read()
+            
+            if offset:
+                tail = tail[tail.find(b'\n') + 1:]  # First line is probably partial
+            
+            # Fast path: take the last "result" string straight from the bytes
+            result = find_result(tail)
             
-            # Try to find JSON result in log
-            lines = content.split('\n')
-            for line in reversed(lines):
-                if '"result":' in line:
-                    try:
-                        data = json.loads(line)
-                        if 'result' in data:
+            lines = tail.split(b'\n')
+            
+            # Slow path: fully parse candidate JSON lines
+            if result is None:
+                for line in reversed(lines):
+                    if b'"result":' in line:
+                        try:
+                            data = _loads(line)
+                        except ValueError:
+                            continue
+                        if isinstance(data, dict) and isinstance(data.get('result'), str):
                             result = data['result']
-                            # Truncate long results
-                            return result[:300] + "..." if len(result) > 300 else result
-                    except json.JSONDecodeError:
-                        continue
+                            break
+            
+            if result is not None:
+                # Truncate long results
+                return result[:300] + "..." if len(result) > 300 else result
             
             # Fallback to last few non-debug lines
-            meaningful_lines = [line for line in lines[-20:] 
-                              if line.strip() and not line.startswith("2026-")]
-            return '\n'.join(meaningful_lines[-5:])[:200]
+            recent = deque(maxlen=5)
+            for line in lines:
+                if line.strip() and not TIMESTAMP_RE.match(line):
+                    recent.append(line)
+            return b'\n'.join(recent).decode('utf-8', 'replace')[:200]
             
         except Exception as e:
             return f"Error reading output: {e}"
\ No newline at end of file
@@ -19,12 +19,19 @@ A small indicator on each box saying name/prompt time alive total token and cost
 # 
 # Based on our proven subagent-dashboard code:
 
+import asyncio
+import sys
+from pathlib import Path
+
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll  
 from textual.widgets import Button, DataTable, Footer, Header, Label, Static
 from textual.reactive import reactive
 from textual.timer import Timer
 
+sys.path.insert(0, str(Path(__file__).parent))
+from runner import Runner
+
 class BlaudeApp(App):
     """Main Blaude TUI Application"""
     
@@ -57,11 +64,18 @@ class BlaudeApp(App):
     
     def on_mount(self) -> None:
         """Initialize the app"""
-        # Set up worker table
+        # Runner shares our event loop, so worker exits are handled between
+        # refreshes rather than on a thread mutating state underneath us
+        self.runner = Runner(loop=asyncio.get_running_loop())
+        self.runner.on_change = lambda names: self.refresh_workers()
+        
+        # Set up worker table, remembering what each row shows so refreshes
+        # only touch the cells that changed
         table = self.query_one("#workers-table", DataTable)
-        table.add_columns("Name", "Status", "Model", "Age", "Target", "PID")
+        self._columns = table.add_columns("Name", "Status", "Model", "Age", "Target", "PID")
+        self._rows = {}  # worker name -> cell values
         
-        # Start auto-refresh
+        # Status changes arrive through on_change; this just keeps ages current
         self.set_interval(3, self.refresh_workers)
         
         # Initial load
@@ -69,13 +83,30 @@ class BlaudeApp(App):
     
     def refresh_workers(self) -> None:
         """Refresh the workers table"""
-        # TODO: Integrate with Runner class
         table = self.query_one("#workers-table", DataTable)
-        table.clear()
         
-        # Placeholder data
-        table.add_row("test-worker", "running", "haiku", "2m", "dev-general", "12345")
-        table.add_row("deploy", "completed", "sonnet", "5m", "ops-lob", "12346")
+        seen = set()
+        for worker in self.runner.list_workers_snapshot():
+            name = worker["name"]
+            age = worker["age_seconds"]
+            age_str = f"{age}s" if age < 60 else f"{age//60}m"
+            pid_str = str(worker["pid"]) if worker["pid"] else "-"
+            values = (name, worker["status"], worker["model"],
+                      age_str, worker["notify_target"], pid_str)
+            
+            shown = self._rows.get(name)
+            if shown is None:
+                table.add_row(*values, key=name)
+            elif shown != values:
+                for column, value, old in zip(self._columns, values, shown):
+                    if value != old:
+                        table.update_cell(name, column, value)
+            self._rows[name] = values
+            seen.add(name)
+        
+        for name in self._rows.keys() - seen:
+            table.remove_row(name)
+            del self._rows[name]
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses"""
@@ -3,27 +3,69 @@
 Blaude Worker TUI - Lazygit-style dashboard for monitoring Claude workers
 """
 import asyncio
-import json
+import os
 import time
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from textual.app import App, ComposeResult
-from textual.containers import Container, Grid, Horizontal, Vertical
-from textual.widgets import Static, Label, Button, TextArea
-from textual.reactive import reactive, var
-from textual.timer import Timer
+from textual.widgets import Static
+from textual.reactive import var
 from rich.text import Text
-from rich.panel import Panel
-from rich.console import Console
-from rich.markup import escape
 
 # Import our blaude modules
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
-from runner import Runner
-from notifier import Notifier
+from runner import TIMESTAMP_RE, Runner, find_result
+
+LOG_TAIL_BYTES = 64 * 1024  # How much of each log a box looks at
+REFRESH_INTERVAL = 2  # Seconds between refreshes when polling
+WATCHED_REFRESH_INTERVAL = 10  # With file watching, the timer only keeps durations ticking
+MAX_IDLE_INTERVAL = 10  # Refreshes back off to this while nothing is running or changing
+CONTENT_REFRESH_EVERY = 5  # Unselected boxes re-read their logs every Nth refresh
+CONTENT_LINES = 10  # Log lines between a box's header and controls
+IO_THREADS = 2  # File reads in flight at once during a refresh
+
+# Selected box after each vim-style move, indexed by the current box (4x2 grid)
+NAV = {
+    "h": (0, 0, 1, 2, 3, 4, 5, 6),
+    "l": (1, 2, 3, 4, 5, 6, 7, 7),
+    "j": (4, 5, 6, 7, 4, 5, 6, 7),
+    "k": (0, 1, 2, 3, 0, 1, 2, 3),
+}
+
+STATUS_ICONS = {
+    "running": "🟢",
+    "completed": "✅", 
+    "killed": "🔴",
+    "dead": "💀",
+    "failed": "❌"
+}
+
+CONTROLS_BY_STATUS = {
+    "running": "[k]Kill [s]Steer [l]Logs [p]Pause",
+    "completed": "[v]View Result [r]Restart [x]Remove",
+}
+DEFAULT_CONTROLS = "[r]Restart [x]Remove [l]Logs"
+
+EMPTY_SLOT_CONTENT = """[n] New Worker
+
+[t] Quick Templates:
+  • Fix Tests  
+  • Update Docs
+  • Deploy Staging
+  • Code Review
+  • Debug Issue"""
+
+def _last_lines(buf: bytes, n: int) -> List[bytes]:
+    """Same as buf.split(b'\\n')[-n:], without splitting the rest of buf"""
+    start = len(buf)
+    for _ in range(n):
+        start = buf.rfind(b'\n', 0, start)
+        if start < 0:
+            break
+    return buf[start + 1:].split(b'\n')
 
 class WorkerBox(Static):
     """Individual worker monitoring box"""
@@ -32,23 +74,28 @@ class WorkerBox(Static):
         self.worker_id = worker_id
         self.worker_data = None
         self.is_selected = False
+        # ((log_file, mtime_ns, size), text) of the last log read
+        self._log_cache: Optional[Tuple[Tuple, str]] = None
+        # (header, content, controls) text currently shown
+        self._last_render: Tuple[Optional[str], ...] = (None, None, None)
         super().__init__(**kwargs)
         self.can_focus = True
     
     def compose(self) -> ComposeResult:
         """Create the worker box layout"""
-        yield Label("", id=f"worker-{self.worker_id}-header")
-        yield Static("", id=f"worker-{self.worker_id}-content", classes="worker-content")
-        yield Label("", id=f"worker-{self.worker_id}-controls")
+        # Header, content and controls are rendered together into one widget,
+        # so a box costs one update and one repaint per change
+        self._body = Static("", id=f"worker-{self.worker_id}-body")
+        yield self._body
     
-    def update_worker(self, worker_data: Optional[Dict] = None):
-        """Update worker box with current data"""
-        self.worker_data = worker_data
+    def update_worker(self, worker_data: Optional[Dict] = None, log_content: Optional[str] = None,
+                      keep_content: bool = False):
+        """Update worker box with current data (log_content if already read)
         
-        # Update header
-        header_widget = self.query_one(f"#worker-{self.worker_id}-header")
-        content_widget = self.query_one(f"#worker-{self.worker_id}-content")
-        controls_widget = self.query_one(f"#worker-{self.worker_id}-controls")
+        With keep_content the log text is left as is; header and controls
+        still update.
+        """
+        self.worker_data = worker_data
         
         if worker_data:
             # Header: name, status, model, duration, cost
@@ -67,103 +114,119 @@ class WorkerBox(Static):
             budget = worker_data.get("budget", 0.0)
             
             # Status icon
-            status_icons = {
-                "running": "🟢",
-                "completed": "✅", 
-                "killed": "🔴",
-                "dead": "💀",
-                "failed": "❌"
-            }
-            icon = status_icons.get(status, "⚪")
+            icon = STATUS_ICONS.get(status, "⚪")
             
             # Duration formatting
-            if age < 60:
-                duration = f"{age}s"
-            elif age < 3600:
-                duration = f"{age//60}m {age%60}s"
+            hours, rest = divmod(age, 3600)
+            minutes, seconds = divmod(rest, 60)
+            if hours:
+                duration = f"{hours}h {minutes}m"
+            elif minutes:
+                duration = f"{minutes}m {seconds}s"
             else:
-                duration = f"{age//3600}h {(age%3600)//60}m"
+                duration = f"{seconds}s"
             
             # Header text
             header_text = f"{icon} {name} | {model} | ${budget:.2f} | {duration}"
-            header_widget.update(header_text)
             
             # Content: reasoning/output from logs
-            log_content = self.get_worker_reasoning(worker_data)
-            content_widget.update(log_content)
+            if keep_content:
+                content_text = self._last_render[1]
+            else:
+                if log_content is None:
+                    log_content = self.get_worker_reasoning(worker_data)
+                content_text = log_content
             
             # Controls
-            if status == "running":
-                controls_widget.update("[k]Kill [s]Steer [l]Logs [p]Pause")
-            elif status == "completed":
-                controls_widget.update("[v]View Result [r]Restart [x]Remove")
-            else:
-                controls_widget.update("[r]Restart [x]Remove [l]Logs")
+            controls_text = CONTROLS_BY_STATUS.get(status, DEFAULT_CONTROLS)
                 
         else:
             # Empty slot
-            header_widget.update("[ Empty Slot ]")
-            content_widget.update(self.get_empty_slot_content())
-            controls_widget.update("[n]New Worker [t]Templates")
+            header_text = "[ Empty Slot ]"
+            content_text = self.get_empty_slot_content()
+            controls_text = "[n]New Worker [t]Templates"
+        
+        # Only re-render when something changed - every update() repaints
+        render = (header_text, content_text, controls_text)
+        if render == self._last_render:
+            return
+        self._last_render = render
+        
+        # Fixed-height content keeps the controls line in place
+        content_lines = (content_text or "").split('\n')[:CONTENT_LINES]
+        content_lines += [""] * (CONTENT_LINES - len(content_lines))
+        self._body.update(Text.assemble(
+            (header_text, "bold"), "\n",
+            '\n'.join(content_lines), "\n",
+            (controls_text, "bold"),
+        ))
     
     def get_worker_reasoning(self, worker_data: Dict) -> str:
         """Extract reasoning/output from worker log file"""
         try:
             log_file = worker_data.get("log_file", "")
-            if not log_file or not Path(log_file).exists():
+            if not log_file:
+                return f"No log: {log_file}"
+            try:
+                st = os.stat(log_file)
+            except FileNotFoundError:
                 return f"No log: {log_file}"
             
-            with open(log_file, 'r') as f:
-                content = f.read()
-            
-            if not content.strip():
-                return "Empty log file"
-            
-            # Look for JSON result first
-            import re
-            json_matches = re.findall(r'{"type":"result".*?}', content)
-            if json_matches:
-                try:
-                    result_data = json.loads(json_matches[-1])
-                    if 'result' in result_data:
-                        result_text = result_data['result']
-                        # Take first few lines for display
-                        lines = result_text.split('\n')[:6]
-                        return '\n'.join(lines)
-                except:
-                    pass
-            
-            # Fallback: extract meaningful non-debug lines
-            lines = content.split('\n')
-            meaningful_lines = []
-            
-            for line in lines[-50:]:  # Last 50 lines
-                if (line.strip() and 
-                    not line.startswith("2026-") and 
-                    not "DEBUG" in line and
-                    len(line.strip()) > 10):
-                    meaningful_lines.append(line.strip())
-            
-            if meaningful_lines:
-                # Take last 6 lines for the box
-                display_lines = meaningful_lines[-6:]
-                return '\n'.join(display_lines)
-            else:
-                return f"Debug only ({len(content)} chars)"
+            # Idle workers cost a stat() per refresh rather than a read
+            key = (log_file, st.st_mtime_ns, st.st_size)
+            if self._log_cache and self._log_cache[0] == key:
+                return self._log_cache[1]
+            text = self._read_reasoning(log_file)
+            self._log_cache = (key, text)
+            return text
             
         except Exception as e:
             return f"Error: {e}"
     
+    def _read_reasoning(self, log_file: str) -> str:
+        """Build the box text from the tail of a log file"""
+        # Only the end of the log is shown, so don't read the rest
+        with open(log_file, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            offset = max(0, size - LOG_TAIL_BYTES)
+            f.seek(offset)
+            tail = f.read()
+        if offset:
+            tail = tail[tail.find(b'\n') + 1:]  # First line is probably partial
+        
+        if not tail.strip():
+            return "Empty log file"
+        
+        # Look for JSON result first - the last one, straight from the bytes
+        # (decoded with orjson when runner has it)
+        result_text = find_result(tail)
+        if result_text is not None:
+            # Take first few lines for display
+            lines = result_text.split('\n')[:6]
+            return '\n'.join(lines)
+        
+        # Fallback: extract meaningful non-debug lines
+        meaningful_lines = []
+        
+        for raw in _last_lines(tail, 50):  # Last 50 lines
+            if TIMESTAMP_RE.match(raw):
+                continue
+            line = raw.decode('utf-8', 'replace')
+            if (line.strip() and 
+                not "DEBUG" in line and
+                len(line.strip()) > 10):
+                meaningful_lines.append(line.strip())
+        
+        if meaningful_lines:
+            # Take last 6 lines for the box
+            display_lines = meaningful_lines[-6:]
+            return '\n'.join(display_lines)
+        else:
+            return f"Debug only ({size} bytes)"
+    
     def get_empty_slot_content(self) -> str:
         """Content for empty worker slots"""
-        return """[n] New Worker
-
-[t] Quick Templates:
-  • Fix Tests  
-  • Update Docs
-  • Deploy Staging
-  • Code Review
-  • Debug Issue"""
+        return EMPTY_SLOT_CONTENT
     
     def update_selection(self, selected: bool):
         """Update visual selection state"""
@@ -195,13 +258,8 @@ class BlaudeTUI(App):
         border: thick blue;
     }
     
-    .worker-content {
-        height: 10;
-        overflow-y: auto;
-    }
-    
-    Label {
-        text-style: bold;
+    WorkerBox Static {
+        height: 1fr;
     }
     """
     
@@ -221,8 +279,22 @@ class BlaudeTUI(App):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.runner = Runner()
+        self.runner = None  # Created in on_mount, on the app's event loop
         self.worker_boxes = []
+        # Workers as of the last refresh, in box order - actions use this
+        # so they act on what's on screen without listing workers again
+        self._last_workers_list: List[Dict] = []
+        self._workers_stamp = None  # From runner.list_workers_since, for _last_workers_list
+        # The timer, file watcher and keys all trigger refreshes; one runs at a time
+        self._refresh_lock = asyncio.Lock()
+        # All refresh file I/O runs here, off the event loop and bounded so
+        # a refresh doesn't hit the disk with a read per box at once
+        self._io_pool = ThreadPoolExecutor(max_workers=IO_THREADS, thread_name_prefix="blaude-tui-io")
+        self._refresh_count = 0
+        self._refresh_timer = None
+        self._refresh_interval = None
+        self._base_interval = REFRESH_INTERVAL
+        self._idle_refreshes = 0  # Consecutive refreshes that found nothing to do
     
     def compose(self) -> ComposeResult:
         """Create the main TUI layout"""
@@ -232,6 +304,9 @@ class BlaudeTUI(App):
     
     def on_mount(self) -> None:
         """Initialize the app"""
+        # Runner handles worker exits on our event loop instead of a thread
+        self.runner = Runner(loop=asyncio.get_running_loop())
+        
         # Store references to worker boxes
         self.worker_boxes = [
             self.query_one(f"#worker-box-{i}") for i in range(8)
@@ -240,41 +315,122 @@ class BlaudeTUI(App):
         # Set initial selection
         self.update_selection()
         
-        # Start auto-refresh timer
-        self.set_interval(2, self.refresh_workers)
+        # Refresh when logs change if watchfiles is installed, else poll
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            self._base_interval = REFRESH_INTERVAL
+        else:
+            self.run_worker(self.watch_logs(awatch), exclusive=True)
+            self.runner.on_change = lambda names: self.call_later(self.refresh_workers)
+            self._base_interval = WATCHED_REFRESH_INTERVAL
+        self.set_refresh_interval(self._base_interval)
         
         # Initial load
-        self.refresh_workers()
+        self.call_later(self.refresh_workers)
+    
+    def set_refresh_interval(self, seconds: float) -> None:
+        """(Re)start the periodic refresh if its interval changed"""
+        if seconds == self._refresh_interval:
+            return
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_interval = seconds
+        self._refresh_timer = self.set_interval(seconds, self.refresh_workers)
+    
+    async def watch_logs(self, awatch) -> None:
+        """Refresh whenever worker logs change (awatch batches bursts of writes)"""
+        async for _ in awatch(self.runner.logs_dir):
+            await self.refresh_workers()
+    
+    def on_unmount(self) -> None:
+        """Stop the I/O threads, dropping any reads not yet started"""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
     
-    def refresh_workers(self) -> None:
+    def load_workers_list(self, since: Optional[tuple]) -> Tuple[tuple, Optional[List[Dict]]]:
+        """(stamp, workers) from disk, workers None if unchanged since `since`
+        
+        Blocking - run off the event loop. Touches no app state; the caller
+        stores the stamp and list together.
+        """
+        # Snapshot plus WAL, so changes from other processes show up at once;
+        # skipped entirely when neither file changed since the last read
+        stamp, all_workers = self.runner.list_workers_since(since)
+        if all_workers is None:
+            return stamp, None
+        
+        # Convert to list format for display
+        workers_list = []
+        for name, data in all_workers.items():
+            worker_info = data.copy()
+            worker_info["name"] = name
+            workers_list.append(worker_info)
+        return stamp, workers_list
+    
+    async def refresh_workers(self) -> None:
         """Refresh worker data and update display"""
+        async with self._refresh_lock:
+            await self._refresh_workers()
+    
+    async def _refresh_workers(self) -> None:
+        """refresh_workers' body - call with _refresh_lock held"""
         try:
-            # Get current workers directly from JSON file
-            workers_file = Path("/tmp/blaude-workers.json")
-            if workers_file.exists():
-                with open(workers_file, 'r') as f:
-                    all_workers = json.load(f)
-                
-                # Convert to list format for display
-                workers_list = []
-                for name, data in all_workers.items():
-                    worker_info = data.copy()
-                    worker_info["name"] = name
-                    workers_list.append(worker_info)
+            # File reads happen in threads so the UI keeps rendering meanwhile
+            loop = asyncio.get_running_loop()
+            stamp, workers_list = await loop.run_in_executor(self._io_pool, self.load_workers_list,
+                                                             self._workers_stamp)
+            changed = workers_list is not None
+            if changed:
+                self._last_workers_list = workers_list
+            else:
+                workers_list = self._last_workers_list
+            self._workers_stamp = stamp
+            
+            # Nothing running and nothing changed: back off, doubling the
+            # interval up to MAX_IDLE_INTERVAL; any activity resets it
+            if changed or any(w["status"] == "running" for w in workers_list):
+                self._idle_refreshes = 0
             else:
-                workers_list = []
+                self._idle_refreshes += 1
+            interval = min(MAX_IDLE_INTERVAL, self._base_interval * 2 ** min(self._idle_refreshes, 4))
+            shown = list(zip(self.worker_boxes, workers_list))
+            
+            # Logs are re-read for the selected box and any box whose worker
+            # changed; the rest only every CONTENT_REFRESH_EVERY refreshes
+            self._refresh_count += 1
+            read_all = self._refresh_count % CONTENT_REFRESH_EVERY == 0
+            to_read = [
+                i for i, (box, worker_data) in enumerate(shown)
+                if read_all or i == self.selected_worker or not box.worker_data
+                or box.worker_data["name"] != worker_data["name"]
+                or box.worker_data["status"] != worker_data["status"]
+            ]
+            contents = dict(zip(to_read, await asyncio.gather(*(
+                loop.run_in_executor(self._io_pool, shown[i][0].get_worker_reasoning, shown[i][1])
+                for i in to_read
+            ))))
             
             # Update each box
-            for i in range(8):
-                if i < len(workers_list):
-                    worker_data = workers_list[i]
-                    self.worker_boxes[i].update_worker(worker_data)
+            for i, (box, worker_data) in enumerate(shown):
+                if i in contents:
+                    box.update_worker(worker_data, contents[i])
                 else:
-                    self.worker_boxes[i].update_worker(None)
+                    box.update_worker(worker_data, keep_content=True)
+            for box in self.worker_boxes[len(shown):]:
+                box.update_worker(None)
+            
+            # Last, with no awaits after it: this may stop the timer running us
+            self.set_refresh_interval(interval)
                     
         except Exception as e:
             self.notify(f"Error refreshing: {e}", severity="error")
     
+    def selected_worker_data(self) -> Optional[Dict]:
+        """The worker in the selected box, as last refreshed"""
+        if self.selected_worker < len(self._last_workers_list):
+            return self._last_workers_list[self.selected_worker]
+        return None
+    
     def update_selection(self) -> None:
         """Update visual selection highlight"""
         for i, box in enumerate(self.worker_boxes):
@@ -284,17 +440,18 @@ class BlaudeTUI(App):
         """Handle selection changes"""
         self.update_selection()
     
-    def action_refresh(self) -> None:
+    async def action_refresh(self) -> None:
         """Manual refresh"""
-        self.refresh_workers()
+        await self.refresh_workers()
         self.notify("Refreshed worker status")
     
     def action_cleanup(self) -> None:
         """Cleanup completed workers"""
         try:
             count = self.runner.cleanup_completed()
+            self._workers_stamp = None  # Full reload
             self.notify(f"Cleaned up {count} workers")
-            self.refresh_workers()
+            self.call_later(self.refresh_workers)
         except Exception as e:
             self.notify(f"Cleanup error: {e}", severity="error")
     
@@ -304,14 +461,20 @@ class BlaudeTUI(App):
     
     def action_kill_worker(self) -> None:
         """Kill selected worker"""
-        workers_list = self.runner.list_workers()
-        if self.selected_worker < len(workers_list):
-            worker = workers_list[self.selected_worker]
+        worker = self.selected_worker_data()
+        if worker:
             try:
-                success = self.runner.kill_worker(worker["name"])
-                if success:
-                    self.notify(f"Killed worker: {worker['name']}")
-                    self.refresh_workers()
+                # The box shows what's on disk; the Runner may not have seen
+                # this worker yet if it was spawned after the TUI started
+                name = worker["name"]
+                self.runner.reload_workers()
+                if self.runner.kill_worker(name):
+                    self.notify(f"Killed worker: {name}")
+                    self.call_later(self.refresh_workers)
+                elif name not in self.runner.workers:
+                    self.notify(f"Worker {name} not found", severity="error")
+                else:
+                    self.notify(f"Worker {name} is not running", severity="error")
             except Exception as e:
                 self.notify(f"Kill error: {e}", severity="error")
     
@@ -321,14 +484,9 @@ class BlaudeTUI(App):
     
     def on_key(self, event) -> None:
         """Handle navigation keys and actions"""
-        if event.key == "h" and self.selected_worker > 0:
-            self.selected_worker = (self.selected_worker - 1) % 8
-        elif event.key == "l" and self.selected_worker < 7:
-            self.selected_worker = (self.selected_worker + 1) % 8
-        elif event.key == "j" and self.selected_worker < 4:
-            self.selected_worker = self.selected_worker + 4
-        elif event.key == "k" and self.selected_worker >= 4:
-            self.selected_worker = self.selected_worker - 4
+        moves = NAV.get(event.key)
+        if moves:
+            self.selected_worker = moves[self.selected_worker]
         elif event.key == "v":
             self.action_view_worker()
         elif event.key == "x":
@@ -337,50 +495,43 @@ class BlaudeTUI(App):
     def action_view_worker(self) -> None:
         """View selected worker's full output"""
         try:
-            # Get worker data
-            workers_file = Path("/tmp/blaude-workers.json")
-            if workers_file.exists():
-                with open(workers_file, 'r') as f:
-                    all_workers = json.load(f)
+            worker_data = self.selected_worker_data()
+            if worker_data:
+                worker_name = worker_data["name"]
                 
-                workers_list = list(all_workers.items())
-                if self.selected_worker < len(workers_list):
-                    worker_name, worker_data = workers_list[self.selected_worker]
-                    
-                    # Show worker details
-                    log_file = worker_data.get("log_file", "")
-                    if Path(log_file).exists():
-                        self.notify(f"Viewing {worker_name} - check log: {log_file}")
-                    else:
-                        self.notify(f"No log file for {worker_name}")
+                # Show worker details
+                log_file = worker_data.get("log_file", "")
+                if Path(log_file).exists():
+                    self.notify(f"Viewing {worker_name} - check log: {log_file}")
                 else:
-                    self.notify("No worker selected")
+                    self.notify(f"No log file for {worker_name}")
+            else:
+                self.notify("No worker selected")
         except Exception as e:
             self.notify(f"View error: {e}", severity="error")
     
     def action_remove_worker(self) -> None:
         """Remove selected worker from tracking"""
         try:
-            workers_file = Path("/tmp/blaude-workers.json")
-            if workers_file.exists():
-                with open(workers_file, 'r') as f:
-                    all_workers = json.load(f)
+            worker_data = self.selected_worker_data()
+            if worker_data:
+                worker_name = worker_data["name"]
+                self.runner.remove_worker(worker_name)
                 
-                workers_list = list(all_workers.keys())
-                if self.selected_worker < len(workers_list):
-                    worker_name = workers_list[self.selected_worker]
-                    del all_workers[worker_name]
-                    
-                    with open(workers_file, 'w') as f:
-                        json.dump(all_workers, f, indent=2)
-                    
-                    self.notify(f"Removed {worker_name}")
-                    self.refresh_workers()
+                self.notify(f"Removed {worker_name}")
+                self.call_later(self.refresh_workers)
         except Exception as e:
             self.notify(f"Remove error: {e}", severity="error")
 
 def main():
     """Launch the Blaude TUI"""
+    # uvloop is optional - a faster event loop when it's installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     app = BlaudeTUI()
     app.run()
 
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Workers store - the workers snapshot plus its append-only change log (WAL)
+
+Every reader replays the WAL over the snapshot; writers append to the WAL
+under a shared flock, and whoever compacts takes it exclusively. Used by
+runner.py, check-completion.py and check-workers.py (blaude-minimal.py keeps
+an inline copy so it stays a single file).
+"""
+import fcntl
+import json
+import os
+from typing import Callable, Dict, Iterable, Optional
+
+# orjson is optional - it's much faster on the workers file and the logs
+try:
+    import orjson
+    
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+    
+    loads = orjson.loads
+except ImportError:
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    loads = json.loads
+
+def wal_path(workers_file) -> str:
+    """The WAL that goes with a snapshot: named after the whole file, so a
+    .json and a .msgpack snapshot never share one"""
+    return str(workers_file) + ".wal"
+
+def apply_entry(workers: Dict, entry: Dict):
+    """Replay one WAL entry over workers"""
+    if entry["op"] == "set":
+        # Partial update: a worker deleted since it was written stays deleted,
+        # rather than coming back as a stub missing model etc.
+        worker = workers.get(entry["name"])
+        if worker is not None:
+            worker.update(entry["fields"])
+    elif entry["op"] == "upsert":
+        workers[entry["name"]] = entry["worker"]
+    elif entry["op"] == "delete":
+        workers.pop(entry["name"], None)
+
+def load(workers_file, wal_file, decode: Callable[[bytes], Dict] = loads,
+         wal_fd: Optional[int] = None) -> Dict:
+    """Workers from the snapshot with the WAL replayed over it
+
+    decode parses the snapshot bytes (JSON unless the caller says otherwise).
+    A compactor already holding the WAL's exclusive lock passes its fd as
+    wal_fd. A snapshot or WAL that can't be read is warned about and skipped.
+    """
+    fd = wal_fd
+    if fd is None:
+        try:
+            fd = os.open(wal_file, os.O_RDONLY)
+        except FileNotFoundError:
+            pass  # No WAL: the snapshot on its own is consistent
+        else:
+            # Held across both reads, so a compaction can't swap the snapshot
+            # and truncate the WAL in between (old snapshot + empty WAL)
+            fcntl.flock(fd, fcntl.LOCK_SH)
+    
+    try:
+        workers = {}
+        try:
+            with open(workers_file, 'rb', buffering=65536) as f:
+                workers = decode(f.read())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Could not load workers file: {e}")
+        
+        if fd is not None:
+            try:
+                for line in _read_all(fd).split(b"\n"):
+                    if not line:
+                        continue
+                    try:
+                        entry = loads(line)
+                    except ValueError:
+                        continue  # Torn write from a crashed process
+                    apply_entry(workers, entry)
+            except Exception as e:
+                print(f"Warning: Could not replay workers WAL: {e}")
+        return workers
+    finally:
+        if fd is not None and wal_fd is None:
+            os.close(fd)  # Also releases the lock
+
+def _read_all(fd: int) -> bytes:
+    """The whole file open on fd, whatever its current offset"""
+    chunks = []
+    offset = 0
+    while True:
+        chunk = os.pread(fd, 65536, offset)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+        offset += len(chunk)
+
+def open_wal(wal_file) -> int:
+    """An fd for append()"""
+    return os.open(wal_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+def append(fd: int, entries: Iterable[Dict], fsync: bool = False):
+    """Append entries to the WAL open on fd (raises OSError)"""
+    data = b"".join(dumps(entry) + b"\n" for entry in entries)
+    if not data:
+        return
+    # Shared lock: appends may interleave, but not with a compaction
+    fcntl.flock(fd, fcntl.LOCK_SH)
+    try:
+        os.write(fd, data)
+        if fsync:
+            os.fsync(fd)
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+def append_to(wal_file, entries: Iterable[Dict]):
+    """append() for one-off writers that don't keep the WAL open"""
+    fd = open_wal(wal_file)
+    try:
+        append(fd, entries)
+    finally:
+        os.close(fd)